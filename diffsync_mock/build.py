@@ -1,68 +1,191 @@
 """Build script used to populate a mock data source."""
-import json
+import asyncio
+import functools
+import mmap
+import multiprocessing
 import os
 
 from argparse import ArgumentParser
-from typing import List, Dict
-from redis import Redis
+from itertools import chain
+from typing import Dict, List
+import msgpack
+from redis import Redis, asyncio as aioredis
 from faker import Faker
-from const import LOCAL_FILE_NAME, REDIS_PORT, REDIS_HOST, DEFAULT_RECORDS, LOGGER
+from diffsync_mock.const import (
+    LOCAL_FILE_NAME,
+    LEGACY_LOCAL_FILE_NAME,
+    REDIS_HOST,
+    REDIS_PORT,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_BATCH_SIZE,
+    DEFAULT_RECORDS,
+    PARALLEL_RECORDS_THRESHOLD,
+    LOGGER,
+)
+from diffsync_mock.utils import batched, json_dumps, json_loads, redis_pool
+
+# Faker provider used to generate each employee field; the same ones `Faker.profile()` uses for these fields.
+_FIELD_PROVIDERS = {
+    "name": "name",
+    "company": "company",
+    "job": "job",
+    "ssn": "ssn",
+    "residence": "address",
+    "username": "user_name",
+    "mail": "free_email",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _faker() -> Faker:
+    """Return this process's Faker instance, built on first use as building one loads every provider for the locale.
+
+    It is seeded from the process ID, as forked pool workers would otherwise replay the parent's random state.
+    """
+    fake = Faker()
+    fake.seed_instance(os.getpid())
+    return fake
+
+
+def _init_worker():
+    """Drop any Faker instance inherited from the parent, so each pool worker builds and seeds its own."""
+    _faker.cache_clear()
 
 
 def generate_data(records: int = DEFAULT_RECORDS) -> List[Dict]:
-    """generate_data function will initialize a Faker instance and generate random employee records.
+    """generate_data function will use the Faker instance to generate random employee records.
 
     Args:
         records (int): Amount of records to generate.
     """
     LOGGER.info("Generating %s random records...", records)
 
-    fake = Faker()
-    data = []
+    if records < PARALLEL_RECORDS_THRESHOLD:
+        return _generate_chunk(0, records)
+
+    # Spread the records as evenly as possible across one worker per core.
+    nproc = os.cpu_count() or 1
+    chunks = []
+    start = 0
+    for index in range(nproc):
+        size = records // nproc + (1 if index < records % nproc else 0)
+        chunks.append((start, size))
+        start += size
+
+    with multiprocessing.Pool(nproc, initializer=_init_worker) as pool:
+        return list(chain.from_iterable(pool.starmap(_generate_chunk, chunks)))
 
-    for _ in range(records):
-        data.append(fake.profile(fields=["job", "company", "ssn", "residence", "username", "name", "mail"]))
 
-    return data
+def _generate_chunk(start: int, records: int) -> List[Dict]:
+    """Generate a chunk of employee records, used by `generate_data` in each worker process.
+
+    Args:
+        start (int): Offset of the first record of this chunk within the full data set.
+        records (int): Amount of records to generate.
+    """
+    fake = _faker()
+    indexes = range(start, start + records)
+
+    # Draw each field as a column, resolving its provider once rather than through the Faker proxy per record.
+    columns = {}
+    for field, provider_name in _FIELD_PROVIDERS.items():
+        provider = getattr(fake, provider_name)
+        columns[field] = [provider() for _ in indexes]
+    # The record's index is appended to the username so it stays unique across the whole data set.
+    columns["username"] = [f"{username}{index}" for username, index in zip(columns["username"], indexes)]
+
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
 
 
 def fetch_local_data() -> List[Dict]:
-    """fetch_local_data function will load the generated 'local' data into memory."""
-    if not os.path.isfile(LOCAL_FILE_NAME):
+    """fetch_local_data function will load the generated 'local' data into memory.
+
+    The MessagePack store is read when it exists, otherwise the JSON store written by earlier versions.
+    """
+    if os.path.isfile(LOCAL_FILE_NAME):
+        file_name, loads = LOCAL_FILE_NAME, functools.partial(msgpack.unpackb, raw=False)
+    elif os.path.isfile(LEGACY_LOCAL_FILE_NAME):
+        file_name, loads = LEGACY_LOCAL_FILE_NAME, json_loads
+    else:
         raise FileNotFoundError(f"'{LOCAL_FILE_NAME}' file not found. Please run 'invoke load-local' first!")
-    with open(LOCAL_FILE_NAME, "r") as file:
-        return json.loads(file.read())
+    # An empty file can't be memory-mapped, and holds no data anyway.
+    if not os.path.getsize(file_name):
+        raise ValueError(f"'{file_name}' is empty. Please run 'invoke load-local' again!")
+    # Parse straight out of the page cache through a memory map instead of first copying the file onto the heap.
+    with open(file_name, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+        with memoryview(raw) as view:
+            return loads(view)
 
 
 def populate_redis(records: int = DEFAULT_RECORDS):
     """Simple function used to generate data and populate redis.
 
-    The 'username' field is used as the redis key for each record.
+    The 'username' field is used as the redis key for each record, and the whole record is stored under it as a
+    single JSON string. Records are written with one MSET per batch of `REDIS_BATCH_SIZE`.
     """
-    redis = Redis(host=REDIS_HOST, port=REDIS_PORT)
-    if redis.flushall():
-        print("Flushed all keys from diffsync redis instance.")
+    redis = Redis(connection_pool=redis_pool())
+    data = generate_data(records=records)
+
+    redis.flushall()
+    for batch in batched(data, REDIS_BATCH_SIZE):
+        # Each batch is sent as soon as it is serialized, so only one batch is ever buffered on the client.
+        redis.mset(_serialize_batch(batch))
+    LOGGER.info("Loaded %s records into redis.", len(data))
 
+
+def populate_redis_concurrent(records: int = DEFAULT_RECORDS):
+    """Generate data and populate redis, writing the batches concurrently over `redis.asyncio`.
+
+    Each batch of `REDIS_BATCH_SIZE` records is one MSET, and up to `REDIS_MAX_CONNECTIONS` of them are in flight
+    at once, so serializing one batch overlaps with the network and server work of the others.
+    """
     data = generate_data(records=records)
-    for index, item in enumerate(data):
-        item["username"] = f"{item['username']}{index}"
-        redis.hset(item["username"], None, None, item)
+    asyncio.run(_populate_redis_concurrent(data))
+    LOGGER.info("Loaded %s records into redis.", len(data))
+
+
+async def _populate_redis_concurrent(data: List[Dict]):
+    # The asyncio pool is bound to the running event loop, so it can't be shared like `redis_pool()`.
+    pool = aioredis.ConnectionPool(host=REDIS_HOST, port=REDIS_PORT, max_connections=REDIS_MAX_CONNECTIONS)
+    redis = aioredis.Redis(connection_pool=pool)
+    # The pool raises rather than waits once it runs out of connections, so cap the calls in flight.
+    slots = asyncio.Semaphore(REDIS_MAX_CONNECTIONS)
+
+    async def write(batch: List[Dict]):
+        mapping = _serialize_batch(batch)
+        async with slots:
+            await redis.mset(mapping)
+
+    try:
+        await redis.flushall()
+        await asyncio.gather(*(write(batch) for batch in batched(data, REDIS_BATCH_SIZE)))
+    finally:
+        await pool.disconnect()
+
+
+def _serialize_batch(batch: List[Dict]) -> Dict[str, bytes]:
+    return {item["username"]: json_dumps(item) for item in batch}
 
 
 def populate_local(records: int = DEFAULT_RECORDS):
-    """Simple function used to generate data and populate the local json file store."""
+    """Simple function used to generate data and populate the local MessagePack file store."""
     data = generate_data(records=records)
-    with open(LOCAL_FILE_NAME, "w") as file:
-        json.dump(data, file, indent=2)
+    with open(LOCAL_FILE_NAME, "wb") as file:
+        file.write(msgpack.packb(data, use_bin_type=True))
 
 
 if __name__ == "__main__":
     parser = ArgumentParser()
     parser.add_argument("--records", default=DEFAULT_RECORDS, help="Amount of records to add to redis.")
     parser.add_argument("--redis", help="Load data into redis.", action="store_true")
-    parser.add_argument("--local", help="Load data into local store (.json file).", action="store_true")
+    parser.add_argument(
+        "--concurrent", help="Write batches to redis concurrently using redis.asyncio.", action="store_true"
+    )
+    parser.add_argument("--local", help="Load data into local store (.msgpack file).", action="store_true")
     args = parser.parse_args()
-    if args.redis:
+    if args.redis and args.concurrent:
+        populate_redis_concurrent(int(args.records))
+    elif args.redis:
         populate_redis(int(args.records))
     elif args.local:
         populate_local(int(args.records))
@@ -7,10 +7,19 @@ logging.basicConfig(level=logging.INFO)
 
 REDIS_PORT = 7379
 REDIS_HOST = "localhost"
+REDIS_MAX_CONNECTIONS = 32
 LOGGER = logging.getLogger("example#5")
 
 
 DIR_PATH = Path(__file__).parent.absolute()
-LOCAL_FILE_NAME = f"{DIR_PATH}/local_adapter.json"
+LOCAL_FILE_NAME = f"{DIR_PATH}/local_adapter.msgpack"
+# JSON store written before the switch to MessagePack; still read when no MessagePack store exists yet.
+LEGACY_LOCAL_FILE_NAME = f"{DIR_PATH}/local_adapter.json"
 
 DEFAULT_RECORDS = 20000
+
+# Below this many records, data is generated in-process rather than across a worker pool.
+PARALLEL_RECORDS_THRESHOLD = 1000
+
+# Number of records written per MSET when populating redis, and keys read per MGET by the redis adapter.
+REDIS_BATCH_SIZE = 1000
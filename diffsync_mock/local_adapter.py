@@ -1,10 +1,10 @@
 """Local adapter used to load 'local' data."""
 from diffsync import DiffSync
-from models import Employee
+from diffsync_mock.models import Employee, FastEmployee
 
 
 class LocalAdapter(DiffSync):
-    """DiffSync Adapter to Load the list of employees from a local JSON file."""
+    """DiffSync Adapter to Load the list of employees from the local MessagePack file store."""
 
     employee = Employee
 
@@ -13,17 +13,22 @@ class LocalAdapter(DiffSync):
     type = "Local"
 
     def load(self, employees):  # pylint: disable=arguments-differ
-        """Load all employees from a local JSON file."""
-        # Load all employees
-        for index, employee in enumerate(employees):
+        """Load all employees from the local MessagePack file store.
+
+        The records are generated by `build.py` and therefore trusted, so they are loaded as slotted `FastEmployee`
+        objects rather than validated pydantic models; any record that is later written to is promoted to a full
+        `Employee` at that point.
+        """
+        for employee in employees:
             self.add(
-                self.employee(
+                FastEmployee(
+                    diffsync=self,
                     name=employee["name"],
                     company=employee["company"],
                     job=employee["job"],
                     ssn=employee["ssn"],
                     residence=employee["residence"],
-                    username=f"{employee['username']}{index}",
+                    username=employee["username"],
                     mail=employee["mail"],
                 )
             )
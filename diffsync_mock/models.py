@@ -1,5 +1,7 @@
 """Models that are used within DiffSync for the Faker data model."""
+from typing import Dict, Mapping, Optional, Text, Tuple
 from diffsync import DiffSyncModel
+from diffsync.enum import DiffSyncModelFlags, DiffSyncStatus
 
 
 class Employee(DiffSyncModel):
@@ -16,3 +18,105 @@ class Employee(DiffSyncModel):
     residence: str
     username: str
     mail: str
+
+
+class FastEmployee:
+    """Slotted, validation-free mirror of `Employee` used when bulk loading trusted data.
+
+    Implements the subset of the DiffSyncModel API that DiffSync uses to store and diff objects, without pydantic's
+    per-instance overhead. Write operations promote the record to a real `Employee` first.
+    """
+
+    __slots__ = (
+        "name",
+        "company",
+        "job",
+        "ssn",
+        "residence",
+        "username",
+        "mail",
+        "diffsync",
+        "model_flags",
+        "_status",
+        "_status_message",
+    )
+
+    _identifiers = Employee._identifiers  # pylint: disable=protected-access
+    _attributes = Employee._attributes  # pylint: disable=protected-access
+
+    def __init__(self, diffsync=None, model_flags: DiffSyncModelFlags = DiffSyncModelFlags.NONE, **fields):
+        """Set the employee fields directly, without any validation."""
+        self.diffsync = diffsync
+        self.model_flags = model_flags
+        self._status = DiffSyncStatus.SUCCESS
+        self._status_message = ""
+        for field, value in fields.items():
+            setattr(self, field, value)
+
+    def __repr__(self):
+        """Represent this object the same way as a DiffSyncModel."""
+        return f'{self.get_type()} "{self.get_unique_id()}"'
+
+    def __str__(self):
+        """Represent this object by its unique ID, the same way as a DiffSyncModel."""
+        return self.get_unique_id()
+
+    @classmethod
+    def get_type(cls) -> Text:
+        """Return the modelname of `Employee`, so both classes share the same store."""
+        return Employee.get_type()
+
+    @classmethod
+    def get_children_mapping(cls) -> Mapping[Text, Text]:
+        """Get the mapping of types to fieldnames for child models of `Employee`."""
+        return Employee.get_children_mapping()
+
+    def get_identifiers(self) -> Dict:
+        """Get a dict of all identifiers and their values for this object."""
+        return {key: getattr(self, key) for key in self._identifiers}
+
+    def get_attrs(self) -> Dict:
+        """Get a dict of all the non-identifier attributes for this object."""
+        return {key: getattr(self, key) for key in self._attributes}
+
+    def get_unique_id(self) -> Text:
+        """Get the unique ID of this object, built the same way as for `Employee`."""
+        return Employee.create_unique_id(**self.get_identifiers())
+
+    def get_shortname(self) -> Text:
+        """Get the shortname of this object, which for `Employee` is its unique ID."""
+        return self.get_unique_id()
+
+    def set_status(self, status: DiffSyncStatus, message: Text = ""):
+        """Update the status (and optionally status message) of this object."""
+        self._status = status
+        self._status_message = message
+
+    def get_status(self) -> Tuple[DiffSyncStatus, Text]:
+        """Get the status of the last create/update/delete operation on this object, and any associated message."""
+        return (self._status, self._status_message)
+
+    def dict(self, **kwargs) -> Dict:  # pylint: disable=unused-argument
+        """Convert this object to a dict of its identifiers and attributes."""
+        return {**self.get_identifiers(), **self.get_attrs()}
+
+    def str(self, include_children: bool = True, indent: int = 0) -> Text:  # pylint: disable=unused-argument
+        """Build a detailed string representation of this object."""
+        return f"{' ' * indent}{self.get_type()}: {self.get_unique_id()}: {self.get_attrs()}"
+
+    def promote(self) -> Employee:
+        """Return this record as a validated `Employee`, replacing it in its DiffSync store if it is in one."""
+        diffsync = self.diffsync
+        employee = Employee(diffsync=diffsync, model_flags=self.model_flags, **self.dict())
+        if diffsync:
+            diffsync.remove(self)
+            diffsync.add(employee)
+        return employee
+
+    def update(self, attrs: Mapping) -> Optional[Employee]:
+        """Promote this record to an `Employee` and update it."""
+        return self.promote().update(attrs)
+
+    def delete(self) -> Optional[Employee]:
+        """Promote this record to an `Employee` and delete it."""
+        return self.promote().delete()
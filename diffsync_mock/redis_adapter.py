@@ -1,10 +1,16 @@
 """Redis adapter used to load 'remote' data."""
+from itertools import chain
 from typing import List, Mapping, Text, Type, Union
 import redis
 
 from diffsync import DiffSync, DiffSyncModel
-from models import Employee
-from const import REDIS_HOST, REDIS_PORT
+from diffsync.exceptions import ObjectNotFound
+from diffsync_mock.models import Employee
+from diffsync_mock.const import LOGGER, REDIS_BATCH_SIZE
+from diffsync_mock.utils import batched, json_dumps, json_loads, redis_pool
+
+# Most keys listed in the message of an error about missing or outdated records.
+MAX_KEYS_IN_ERROR = 10
 
 
 class RedisEmployee(Employee):
@@ -22,17 +28,10 @@ class RedisEmployee(Employee):
         Returns:
             Employee: DiffSync object newly created
         """
-        # Create the new employee in Redis.
-        diffsync.redis.set(
-            username=ids.get("username"),
-            company=attrs.get("company"),
-            job=attrs.get("job"),
-            ssn=attrs.get("ssn"),
-            residence=attrs.get("residence"),
-            name=attrs.get("name"),
-            mail=attrs.get("mail"),
-        )
-        print(f"Created Employee : {ids} | {attrs}")
+        # Create the new employee in Redis, stored as a single JSON string under its username.
+        diffsync.redis.set(ids["username"], json_dumps({**ids, **attrs}))
+        # Counted rather than printed per record; RedisAdapter.sync_complete logs the total once.
+        diffsync.employees_created += 1
 
         # Add the newly created remote_id and create the internal object for this resource.
         item = super().create(ids=ids, diffsync=diffsync, attrs=attrs)
@@ -51,7 +50,8 @@ class RedisEmployee(Employee):
         Raises:
             ObjectNotUpdated: if an error occurred.
         """
-        self.diffsync.redis.hset(attrs["username"], None, None, attrs)
+        record = {**self.get_identifiers(), **self.get_attrs(), **attrs}
+        self.diffsync.redis.set(self.username, json_dumps(record))
 
         return super().update(attrs)
 
@@ -68,18 +68,12 @@ class RedisEmployee(Employee):
         return self
 
     @classmethod
-    def convert_from(cls, diffsync, obj):
-        """Convert a Redis Employee object into an Employee object."""
-        return cls(
-            diffsync=diffsync,
-            name=obj[b"name"],
-            company=obj[b"company"],
-            job=obj[b"job"],
-            ssn=obj[b"ssn"],
-            residence=obj[b"residence"],
-            username=obj[b"username"],
-            mail=obj[b"mail"],
-        )
+    def convert_from(cls, diffsync, raw):
+        """Convert a Redis Employee JSON string into an Employee object.
+
+        The records were written by this project, so the model is built with `construct()` to skip validation.
+        """
+        return cls.construct(diffsync=diffsync, **json_loads(raw))
 
     # -----------------------------------------------------
     # Redefine the default methods to access the objects from the store to implement a storeless adapter
@@ -87,29 +81,64 @@ class RedisEmployee(Employee):
     @classmethod
     def get_all(cls, diffsync):
         """Get all Employee objects from Redis."""
-        results = []
-        for key in diffsync.redis.keys("*"):
-            results.append(cls.convert_from(diffsync, diffsync.redis.hgetall(key)))
-        return results
+        return cls.get_many(diffsync, diffsync.redis.scan_iter(match="*", count=REDIS_BATCH_SIZE))
 
     @classmethod
     def get_by_uids(cls, diffsync, uids):
         """Get a list of Employees identified by their unique identifiers."""
-        results = []
-        for key in diffsync.redis.mget(uids):
-            results.append(cls.convert_from(diffsync, diffsync.redis.hgetall(key)))
-        return results
+        return cls.get_many(diffsync, uids)
+
+    @classmethod
+    def get_many(cls, diffsync, keys):
+        """Fetch the Employees stored under `keys`, with one pipelined MGET per batch of `REDIS_BATCH_SIZE` keys.
+
+        Raises:
+            ObjectNotFound: if any of the keys are not present in Redis
+            ValueError: if any of the keys hold records in the format used before they were stored as JSON strings
+        """
+        keys = list(keys)
+        pipe = diffsync.redis.pipeline(transaction=False)
+        for batch in batched(keys, REDIS_BATCH_SIZE):
+            pipe.mget(batch)
+        records = list(chain.from_iterable(pipe.execute()))
+
+        if None in records:
+            cls._raise_unreadable(diffsync, [key for key, raw in zip(keys, records) if raw is None])
+        return [cls.convert_from(diffsync, raw) for raw in records]
+
+    @classmethod
+    def _raise_unreadable(cls, diffsync, keys):
+        # MGET returns None both for missing keys and for keys of another type, such as the hashes older versions
+        # stored each record in, so look up which of the two each key is.
+        pipe = diffsync.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.type(key)
+        outdated = [key for key, key_type in zip(keys, pipe.execute()) if key_type != "none"]
+
+        if outdated:
+            raise ValueError(
+                f"{len(outdated)} {cls.get_type()} records in Redis are in an outdated format, e.g. "
+                f"{outdated[:MAX_KEYS_IN_ERROR]}. Please run 'invoke load-redis' again!"
+            )
+        more = f" and {len(keys) - MAX_KEYS_IN_ERROR} more" if len(keys) > MAX_KEYS_IN_ERROR else ""
+        raise ObjectNotFound(f"{cls.get_type()} {keys[:MAX_KEYS_IN_ERROR]}{more} not present in Redis")
 
     @classmethod
     def get(cls, diffsync, identifier):
         """Return an instance of an Employee based on their unique identifier."""
         if isinstance(identifier, str):
-            employee = diffsync.redis.hgetall(identifier)
+            uid = identifier
         elif isinstance(identifier, dict):
-            employee = diffsync.redis.hgetall(**identifier)
+            uid = cls.create_unique_id(**identifier)
         else:
             raise TypeError
 
+        try:
+            employee = diffsync.redis.get(uid)
+        except redis.exceptions.ResponseError:
+            cls._raise_unreadable(diffsync, [uid])
+        if employee is None:
+            raise ObjectNotFound(f"{cls.get_type()} {uid} not present in Redis")
         return cls.convert_from(diffsync, employee)
 
 
@@ -124,12 +153,19 @@ class RedisAdapter(DiffSync):
 
     def __init__(self, *args, **kwargs):
         """Initialize the redis client."""
-        self.redis = redis.Redis(host=REDIS_HOST, port=REDIS_PORT)
+        self.redis = redis.Redis(connection_pool=redis_pool())
+        self.employees_created = 0
         super().__init__(*args, **kwargs)
 
     def load(self):
         """Nothing to load here since this adapter is not leveraging the internal datastore."""
 
+    def sync_complete(self, source: DiffSync, *args, **kwargs):
+        """Log a summary of the employees created in Redis once the sync has completed, then reset the count."""
+        LOGGER.info("Created %s employees in Redis from %s.", self.employees_created, source)
+        self.employees_created = 0
+        super().sync_complete(source, *args, **kwargs)
+
     def get(
         self, obj: Union[Text, DiffSyncModel, Type[DiffSyncModel]], identifier: Union[Text, Mapping]
     ) -> DiffSyncModel:
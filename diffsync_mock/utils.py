@@ -0,0 +1,54 @@
+"""Helper functions shared by the build script and the adapters."""
+import functools
+import json
+
+from itertools import islice
+from typing import Iterable, Iterator, List
+from redis import ConnectionPool
+from diffsync_mock.const import REDIS_HOST, REDIS_MAX_CONNECTIONS, REDIS_PORT
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(data) -> bytes:
+    """Serialize `data` to compact JSON bytes, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def json_loads(raw):
+    """Deserialize JSON from a `str`, `bytes` or any other buffer such as a `memoryview`.
+
+    orjson is used when it is installed; the stdlib fallback needs the buffer copied into `bytes` first.
+    """
+    if orjson:
+        return orjson.loads(raw)
+    if not isinstance(raw, (str, bytes, bytearray)):
+        raw = bytes(raw)
+    return json.loads(raw)
+
+
+def batched(items: Iterable, size: int) -> Iterator[List]:
+    """Yield successive lists of at most `size` items from `items`."""
+    iterator = iter(items)
+    batch = list(islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, size))
+
+
+@functools.lru_cache(maxsize=1)
+def redis_pool() -> ConnectionPool:
+    """Return the connection pool shared by every redis client in the process, created on first use.
+
+    Sharing it means connections are reused rather than re-established per client. Replies are decoded to `str` by the
+    connection's parser, so callers never deal with raw bytes. The parser is redis-py's `DefaultParser`, which is the
+    C-backed `HiredisParser` whenever `hiredis` is installed.
+    """
+    return ConnectionPool(
+        host=REDIS_HOST, port=REDIS_PORT, max_connections=REDIS_MAX_CONNECTIONS, decode_responses=True
+    )
@@ -1,73 +1,118 @@
 """Tasks for use with Invoke."""
+import functools
 import os
+import shlex
 import sys
-from invoke import task
-from diffsync_mock.const import DEFAULT_RECORDS
+from concurrent.futures import ThreadPoolExecutor
+from invoke import Exit, task
+from diffsync_mock.const import DEFAULT_RECORDS, REDIS_PORT
 
-try:
-    import toml
-except ImportError:
-    sys.exit("Please make sure to `pip install toml` or enable the Poetry shell and run `poetry install`.")
-
-
-PYPROJECT_CONFIG = toml.load("pyproject.toml")
-TOOL_CONFIG = PYPROJECT_CONFIG["tool"]["poetry"]
 
 # Can be set to a separate Python version to be used for launching or building image
-PYTHON_VER = os.getenv("PYTHON_VER", "3.6")
+PYTHON_VER = os.getenv("PYTHON_VER", "3.7")
 PKG_NAME = "diffsync_mock"
 CONTAINER_NAME = "diffsync-redis-1"
+# Pinned, so an image that is already pulled is reused instead of re-resolving `latest` against the registry.
+REDIS_IMAGE = "redis:7-alpine"
+
+# Whether each container is running, as last seen by `container_up` in this invoke process.
+_CONTAINER_STATE = {}
+
+# Linters run by the `tests` task, keyed by the name of the task that runs each one on its own.
+# `{paths}` is the files or directories to check, "." for the whole tree.
+LINT_COMMANDS = {
+    "black": "black --check --diff {paths}",
+    "flake8": "flake8 {paths}",
+    "pylint": "pylint --jobs=0 --recursive=y {paths}",
+    "pydocstyle": "pydocstyle {paths}",
+    "bandit": "bandit --recursive --configfile .bandit.yml {paths}",
+}
+# Ref that `tests` diffs against to find the Python files a branch has changed.
+DIFF_BASE = os.getenv("DIFF_BASE", "origin/main")
+# Linters configured to skip tests/ (.pydocstyle.ini's match-dir), which they only apply when walking a directory.
+SKIP_TESTS = {"pydocstyle"}
+
+
+def _exec(argv):
+    """Replace the invoke process with `argv`, skipping the shell and extra process that `context.run` would start.
+
+    Nothing after this call runs, so it must be the last step of a task, and tasks chained after it on the same
+    command line are not run.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    # argv is always built by the tasks below, never taken from the shell.
+    os.execvp(argv[0], argv)  # nosec B606
 
 
 @task
-def run(context, redis=False):
+def run(context, redis=False):  # pylint: disable=unused-argument
     """Run the main python script to execute mocks."""
-    cmd = "fil-profile run diffsync_mock/main.py"
+    cmd = ["fil-profile", "run", "-m", f"{PKG_NAME}.main"]
     if redis:
-        cmd += " --redis"
-    context.run(cmd, pty=True)
+        cmd.append("--redis")
+    _exec(cmd)
 
 
 @task
-def load_redis(context, records=DEFAULT_RECORDS):
+def load_redis(context, records=DEFAULT_RECORDS, concurrent=False):
     """Run build.py script to load redis with mock data.
 
     Args:
         records (int): Amount of mock records to add.
+        concurrent (bool): Write the records using concurrent asyncio pipelines.
         context (obj): Used to run specific commands
     """
     start(context)
-    cmd = f"python {PKG_NAME}/build.py --records {records} --redis"
-    context.run(cmd, pty=True)
+    cmd = ["python", "-m", f"{PKG_NAME}.build", "--records", str(records), "--redis"]
+    if concurrent:
+        cmd.append("--concurrent")
+    _exec(cmd)
 
 
 @task
-def load_local(context, records=DEFAULT_RECORDS):
+def load_local(context, records=DEFAULT_RECORDS):  # pylint: disable=unused-argument
     """Run build.py script to generate a mock of local data.
 
     Args:
         records (int): Amount of mock records to add.
         context (obj): Used to run specific commands
     """
-    cmd = f"python {PKG_NAME}/build.py --records {records} --local"
-    context.run(cmd, pty=True)
+    _exec(["python", "-m", f"{PKG_NAME}.build", "--records", str(records), "--local"])
+
+
+@functools.lru_cache(maxsize=1)
+def _docker_client():
+    """Return a Docker SDK client, which talks to the daemon's API directly instead of forking the docker CLI."""
+    import docker  # pylint: disable=import-outside-toplevel
+
+    return docker.from_env()
 
 
 @task
-def container_up(context, name):
-    """This will enter the image to perform troubleshooting or dev work.
+def container_up(context, name):  # pylint: disable=unused-argument
+    """Check if a container is running, asking the Docker daemon directly rather than shelling out to `docker ps`.
+
+    The answer is cached for the rest of the invoke process, until `start` or `stop` change it. Set `TASKS_NO_CACHE`
+    in the environment to always ask the daemon.
 
     Args:
         context (obj): Used to run specific commands
         name (str): name of the container to test if up.
     """
-    result = context.run(f"docker ps --filter name={name}", hide="out")
-    return name in result.stdout
+    if os.getenv("TASKS_NO_CACHE"):
+        _CONTAINER_STATE.clear()
+    if name not in _CONTAINER_STATE:
+        # Anchor the name so the daemon only returns an exact match, and list sparsely so the SDK skips inspecting
+        # each container; only whether anything matched is needed.
+        containers = _docker_client().containers.list(filters={"name": f"^/?{name}$"}, sparse=True)
+        _CONTAINER_STATE[name] = bool(containers)
+    return _CONTAINER_STATE[name]
 
 
 @task
 def start(context):
-    """This will enter the image to perform troubleshooting or dev work.
+    """Start the redis container through the Docker API, unless it is already running.
 
     Args:
         context (obj): Used to run specific commands
@@ -77,68 +122,165 @@ def start(context):
         print("Redis container already running.")
         return
 
+    from docker.errors import APIError  # pylint: disable=import-outside-toplevel
+
     print("Starting redis container.")
-    context.run(f"docker run --name {CONTAINER_NAME} -p 7379:6379 -d redis", pty=True)
+    client = _docker_client()
+    try:
+        client.containers.run(REDIS_IMAGE, name=CONTAINER_NAME, ports={"6379/tcp": REDIS_PORT}, detach=True)
+    except APIError as error:
+        if error.status_code != 409:
+            raise
+        # The container exists but is stopped, so start it again rather than creating a new one.
+        client.containers.get(CONTAINER_NAME).start()
+    _CONTAINER_STATE.pop(CONTAINER_NAME, None)
 
 
 @task
-def stop(context):
-    """This will enter the image to perform troubleshooting or dev work.
+def stop(context):  # pylint: disable=unused-argument
+    """Stop and remove the redis container through the Docker API, if it exists.
 
     Args:
         context (obj): Used to run specific commands
     """
-    is_up = container_up(context, CONTAINER_NAME)
-    if not is_up:
+    from docker.errors import NotFound  # pylint: disable=import-outside-toplevel
+
+    try:
+        container = _docker_client().containers.get(CONTAINER_NAME)
+    except NotFound:
         print("Redis container not running.")
         return
 
     print("Stopping redis container.")
-    context.run(f"docker rm {CONTAINER_NAME}", pty=True)
+    container.remove(force=True)
+    _CONTAINER_STATE.pop(CONTAINER_NAME, None)
 
 
 @task()
 def black(context):
     """Run black to check that Python files adherence to black standards."""
-    exec_cmd = "black --check --diff ."
-    context.run(exec_cmd, pty=True)
+    exec_cmd = LINT_COMMANDS["black"].format(paths=".")
+    context.run(exec_cmd)
 
 
 @task()
 def flake8(context):
     """Run flake8 code analysis."""
-    exec_cmd = "flake8 ."
-    context.run(exec_cmd, pty=True)
+    exec_cmd = LINT_COMMANDS["flake8"].format(paths=".")
+    context.run(exec_cmd)
 
 
 @task()
 def pylint(context):
     """Run pylint code analysis."""
-    exec_cmd = 'find . -name "*.py" | xargs pylint'
-    context.run(exec_cmd, pty=True)
+    exec_cmd = LINT_COMMANDS["pylint"].format(paths=".")
+    context.run(exec_cmd)
 
 
 @task()
 def pydocstyle(context):
     """Run pydocstyle to validate docstring formatting adheres to NTC defined standards."""
-    exec_cmd = "pydocstyle ."
-    context.run(exec_cmd, pty=True)
+    exec_cmd = LINT_COMMANDS["pydocstyle"].format(paths=".")
+    context.run(exec_cmd)
 
 
 @task()
 def bandit(context):
     """Run bandit to validate basic static code security analysis."""
-    exec_cmd = "bandit --recursive ./ --configfile .bandit.yml"
-    context.run(exec_cmd, pty=True)
+    exec_cmd = LINT_COMMANDS["bandit"].format(paths=".")
+    context.run(exec_cmd)
+
+
+@task()
+def pytest(context):
+    """Run pytest test cases."""
+    exec_cmd = "pytest"
+    context.run(exec_cmd)
+
+
+def _changed_files(context):
+    """Return the Python files this branch has changed since `DIFF_BASE`, or None if the whole tree should be checked.
+
+    Untracked files are included, so new modules are checked before they are committed.
+    """
+    if os.getenv("CI_FULL") == "1":
+        return None
+    # Diff from where the branch left `DIFF_BASE`, so changes made only on `DIFF_BASE` since then aren't included.
+    base = context.run(f"git merge-base {shlex.quote(DIFF_BASE)} HEAD", hide=True, warn=True, pty=False)
+    if not base.ok:
+        print(f"Could not diff against {DIFF_BASE}, checking the whole tree.")
+        return None
+    # Every change except deletions, so renamed and copied files are checked under their new names.
+    changed = context.run(
+        f"git diff --name-only --diff-filter=d {base.stdout.strip()} -- '*.py'", hide=True, warn=True, pty=False
+    )
+    untracked = context.run("git ls-files --others --exclude-standard -- '*.py'", hide=True, warn=True, pty=False)
+    if not (changed.ok and untracked.ok):
+        print(f"Could not diff against {DIFF_BASE}, checking the whole tree.")
+        return None
+    files = list(dict.fromkeys(changed.stdout.splitlines() + untracked.stdout.splitlines()))
+    if not files:
+        print(f"No Python files changed since {DIFF_BASE}, checking the whole tree.")
+        return None
+    return files
+
+
+def _lint_commands(files):
+    """Return the command for each linter in `LINT_COMMANDS`, checking `files`, or the whole tree if it is None.
+
+    A linter left with no files to check is skipped.
+    """
+    if files is None:
+        return {name: exec_cmd.format(paths=".") for name, exec_cmd in LINT_COMMANDS.items()}
+
+    commands = {}
+    for name, exec_cmd in LINT_COMMANDS.items():
+        paths = [file for file in files if not (name in SKIP_TESTS and file.startswith("tests/"))]
+        if paths:
+            # bandit only matches its exclude_dirs ("./tests/") against paths written relative to "./".
+            commands[name] = exec_cmd.format(paths=" ".join(shlex.quote(f"./{path}") for path in paths))
+    return commands
 
 
 @task()
 def tests(context):
-    """Run all tests for this repository."""
-    black(context)
-    flake8(context)
-    pylint(context)
-    pydocstyle(context)
-    bandit(context)
+    """Run all tests for this repository.
+
+    The linters and the pytest suite don't depend on each other, so they all run at once and each one's output is
+    printed as a block once they have finished.
 
+    The linters only check the Python files this branch has changed since `DIFF_BASE`, including untracked ones.
+    They check the whole tree instead when `CI_FULL=1` is set, when no Python files have changed, or when the diff
+    can't be taken (e.g. the base ref hasn't been fetched).
+    """
+    commands = _lint_commands(_changed_files(context))
+    # The unit tests exercise the package as a whole, so they always run in full.
+    commands["pytest"] = "pytest"
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        results = {
+            name: executor.submit(context.run, exec_cmd, hide=True, warn=True, pty=False)
+            for name, exec_cmd in commands.items()
+        }
+
+    failed = []
+    for name, future in results.items():
+        result = future.result()
+        print(f"--- {name} ---")
+        print(result.stdout, end="")
+        print(result.stderr, end="", file=sys.stderr)
+        if not result.ok:
+            failed.append(name)
+
+    if failed:
+        raise Exit(f"Failed: {', '.join(failed)}", code=1)
     print("All tests have passed!")
+
+
+@task()
+def tests_fast(context):
+    """Run the same linters as `tests` through pre-commit, using the hooks in .pre-commit-config.yaml.
+
+    pre-commit hands each hook only the Python files it applies to and splits them across processes.
+    """
+    exec_cmd = "pre-commit run --all-files"
+    context.run(exec_cmd)
@@ -0,0 +1 @@
+"""Unit tests for diffsync_mock."""
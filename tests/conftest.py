@@ -0,0 +1,100 @@
+"""Fixtures shared by the diffsync_mock unit tests."""
+# pylint: disable=redefined-outer-name
+import fakeredis
+import pytest
+
+from diffsync import DiffSync
+from diffsync_mock import build
+from diffsync_mock.local_adapter import LocalAdapter
+from diffsync_mock.models import Employee
+from diffsync_mock.redis_adapter import RedisAdapter
+
+
+class EmployeeAdapter(DiffSync):
+    """Adapter that stores fully validated `Employee` models, to sync against `FastEmployee` stores."""
+
+    employee = Employee
+
+    top_level = ["employee"]
+
+    type = "Employee"
+
+    def load(self, employees):  # pylint: disable=arguments-differ
+        """Load `employees` as `Employee` models."""
+        for employee in employees:
+            self.add(Employee(diffsync=self, **employee))
+
+
+@pytest.fixture
+def employees():
+    """Records shaped like the ones generated by `build.generate_data`."""
+    return [
+        {
+            "name": f"Employee {index}",
+            "company": "Network to Code",
+            "job": "Engineer",
+            "ssn": f"000-00-000{index}",
+            "residence": f"{index} Main Street",
+            "username": f"employee{index}",
+            "mail": f"employee{index}@example.com",
+        }
+        for index in range(3)
+    ]
+
+
+@pytest.fixture
+def changed_employees(employees):
+    """`employees` with the first one changed, the second one removed and a new one added."""
+    changed = [{**employees[0], "job": "Manager"}, employees[2]]
+    changed.append({**employees[1], "username": "employee3", "mail": "employee3@example.com"})
+    return changed
+
+
+@pytest.fixture
+def local_adapter(employees):
+    """A LocalAdapter loaded with `employees` as `FastEmployee` objects."""
+    adapter = LocalAdapter()
+    adapter.load(employees)
+    return adapter
+
+
+@pytest.fixture
+def employee_adapter(employees):
+    """An EmployeeAdapter loaded with `employees`."""
+    adapter = EmployeeAdapter()
+    adapter.load(employees)
+    return adapter
+
+
+@pytest.fixture
+def changed_adapter(changed_employees):
+    """An EmployeeAdapter loaded with `changed_employees`."""
+    adapter = EmployeeAdapter()
+    adapter.load(changed_employees)
+    return adapter
+
+
+@pytest.fixture
+def changed_local_adapter(changed_employees):
+    """A LocalAdapter loaded with `changed_employees`."""
+    adapter = LocalAdapter()
+    adapter.load(changed_employees)
+    return adapter
+
+
+@pytest.fixture
+def redis_adapter():
+    """An empty RedisAdapter backed by an in-memory fake redis server."""
+    adapter = RedisAdapter()
+    adapter.redis = fakeredis.FakeRedis(decode_responses=True)
+    adapter.load()
+    return adapter
+
+
+@pytest.fixture
+def local_files(tmp_path, monkeypatch):
+    """Point the local store, and the legacy JSON store, at files in a temporary directory."""
+    msgpack_file, json_file = tmp_path / "local_adapter.msgpack", tmp_path / "local_adapter.json"
+    monkeypatch.setattr(build, "LOCAL_FILE_NAME", str(msgpack_file))
+    monkeypatch.setattr(build, "LEGACY_LOCAL_FILE_NAME", str(json_file))
+    return msgpack_file, json_file
@@ -0,0 +1,79 @@
+"""Unit tests for the build script."""
+import json
+import multiprocessing
+
+import fakeredis
+import pytest
+
+from diffsync_mock import build
+from diffsync_mock.const import PARALLEL_RECORDS_THRESHOLD
+from diffsync_mock.utils import json_loads
+
+
+def test_generate_data_across_workers(monkeypatch):
+    records = PARALLEL_RECORDS_THRESHOLD + 7
+    monkeypatch.setattr(build.os, "cpu_count", lambda: 4)
+
+    data = build.generate_data(records)
+
+    assert len(data) == records
+    assert len({item["username"] for item in data}) == records
+    assert all(item["username"].endswith(str(index)) for index, item in enumerate(data))
+
+
+def test_generate_data_in_process(monkeypatch):
+    def no_pool(*_args, **_kwargs):
+        pytest.fail("Small data sets should be generated without a worker pool.")
+
+    monkeypatch.setattr(multiprocessing, "Pool", no_pool)
+
+    data = build.generate_data(5)
+
+    assert [item["username"][-1] for item in data] == ["0", "1", "2", "3", "4"]
+    assert set(data[0]) == {"name", "company", "job", "ssn", "residence", "username", "mail"}
+
+
+def test_local_store_round_trip(local_files):
+    msgpack_file, _ = local_files
+
+    build.populate_local(5)
+
+    assert msgpack_file.is_file()
+    data = build.fetch_local_data()
+    assert len(data) == 5
+    assert [item["username"][-1] for item in data] == ["0", "1", "2", "3", "4"]
+
+
+def test_fetch_legacy_json_store(local_files):
+    _, json_file = local_files
+    records = [{"username": "employee0", "name": "Employee 0"}]
+    json_file.write_text(json.dumps(records))
+
+    assert build.fetch_local_data() == records
+
+
+def test_fetch_empty_store(local_files):
+    msgpack_file, _ = local_files
+    msgpack_file.touch()
+
+    with pytest.raises(ValueError, match="is empty"):
+        build.fetch_local_data()
+
+
+@pytest.mark.usefixtures("local_files")
+def test_fetch_missing_store():
+    with pytest.raises(FileNotFoundError, match="invoke load-local"):
+        build.fetch_local_data()
+
+
+def test_populate_redis(monkeypatch):
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    redis.set("stale", "record")
+    monkeypatch.setattr(build, "REDIS_BATCH_SIZE", 2)
+    monkeypatch.setattr(build, "Redis", lambda connection_pool: redis)
+
+    build.populate_redis(5)
+
+    assert redis.dbsize() == 5
+    for key in redis.keys():
+        assert json_loads(redis.get(key))["username"] == key
@@ -0,0 +1,88 @@
+"""Unit tests for the FastEmployee model."""
+from diffsync.enum import DiffSyncModelFlags, DiffSyncStatus
+from diffsync_mock.local_adapter import LocalAdapter
+from diffsync_mock.models import Employee, FastEmployee
+
+
+def test_fast_employee_matches_employee(employees):
+    fast = FastEmployee(**employees[0])
+    employee = Employee(**employees[0])
+
+    assert fast.get_type() == employee.get_type()
+    assert fast.get_unique_id() == employee.get_unique_id()
+    assert fast.get_identifiers() == employee.get_identifiers()
+    assert fast.get_attrs() == employee.get_attrs()
+    assert fast.dict() == employees[0]
+
+
+def test_fast_employee_model_flags_per_instance(employees):
+    ignored, other = FastEmployee(**employees[0]), FastEmployee(**employees[1])
+    ignored.model_flags = DiffSyncModelFlags.IGNORE
+
+    assert ignored.model_flags == DiffSyncModelFlags.IGNORE
+    assert other.model_flags == DiffSyncModelFlags.NONE
+
+
+def test_fast_employee_status(employees):
+    fast = FastEmployee(**employees[0])
+    assert fast.get_status() == (DiffSyncStatus.SUCCESS, "")
+
+    fast.set_status(DiffSyncStatus.ERROR, "failed")
+    assert fast.get_status() == (DiffSyncStatus.ERROR, "failed")
+
+
+def test_diff_from_without_changes(local_adapter, employee_adapter):
+    assert not employee_adapter.diff_from(local_adapter).has_diffs()
+    assert not local_adapter.diff_from(employee_adapter).has_diffs()
+
+
+def test_diff_from_with_changes(local_adapter, changed_adapter):
+    summary = local_adapter.diff_from(changed_adapter).summary()
+    assert (summary["create"], summary["update"], summary["delete"]) == (1, 1, 1)
+
+
+def test_diff_from_skips_ignored(local_adapter, changed_adapter):
+    local_adapter.get("employee", "employee0").model_flags = DiffSyncModelFlags.IGNORE
+
+    summary = local_adapter.diff_from(changed_adapter).summary()
+    assert (summary["create"], summary["update"], summary["delete"]) == (1, 0, 1)
+
+
+def test_sync_from_fast_employees(local_adapter, changed_adapter):
+    changed_adapter.sync_from(local_adapter)
+
+    assert not changed_adapter.diff_from(local_adapter).has_diffs()
+    assert changed_adapter.get("employee", "employee0").job == "Engineer"
+    assert {employee.username for employee in changed_adapter.get_all("employee")} == {
+        "employee0",
+        "employee1",
+        "employee2",
+    }
+
+
+def test_sync_to_fast_employees(local_adapter, changed_adapter):
+    local_adapter.sync_from(changed_adapter)
+
+    assert not local_adapter.diff_from(changed_adapter).has_diffs()
+    updated = local_adapter.get("employee", "employee0")
+    assert isinstance(updated, Employee)
+    assert updated.job == "Manager"
+    assert isinstance(local_adapter.get("employee", "employee2"), FastEmployee)
+    assert {employee.username for employee in local_adapter.get_all("employee")} == {
+        "employee0",
+        "employee2",
+        "employee3",
+    }
+
+
+def test_promote_replaces_fast_employee(employees):
+    adapter = LocalAdapter()
+    adapter.load(employees[:1])
+    fast = adapter.get("employee", "employee0")
+    fast.model_flags = DiffSyncModelFlags.IGNORE
+
+    employee = fast.promote()
+
+    assert adapter.get("employee", "employee0") is employee
+    assert {**employee.get_identifiers(), **employee.get_attrs()} == employees[0]
+    assert employee.model_flags == DiffSyncModelFlags.IGNORE
@@ -0,0 +1,66 @@
+"""Unit tests for the Redis adapter."""
+import logging
+
+import pytest
+
+from diffsync.exceptions import ObjectNotFound
+
+from diffsync_mock.const import LOGGER
+from diffsync_mock.utils import json_loads
+
+
+def test_sync_creates_employees(redis_adapter, local_adapter, employees, caplog):
+    with caplog.at_level(logging.INFO, logger=LOGGER.name):
+        redis_adapter.sync_from(local_adapter)
+
+    assert "Created 3 employees in Redis" in caplog.text
+    assert redis_adapter.employees_created == 0
+    assert {key: json_loads(raw) for key, raw in zip(*_dump(redis_adapter))} == {
+        employee["username"]: employee for employee in employees
+    }
+    assert not redis_adapter.diff_from(local_adapter).has_diffs()
+
+
+def test_sync_updates_and_deletes_employees(redis_adapter, local_adapter, changed_local_adapter):
+    redis_adapter.sync_from(local_adapter)
+
+    redis_adapter.sync_from(changed_local_adapter)
+
+    keys, records = _dump(redis_adapter)
+    assert keys == ["employee0", "employee2", "employee3"]
+    assert json_loads(records[0])["job"] == "Manager"
+    assert redis_adapter.get("employee", "employee0").job == "Manager"
+    assert not redis_adapter.diff_from(changed_local_adapter).has_diffs()
+
+
+def test_sync_counts_each_sync_separately(redis_adapter, local_adapter, changed_local_adapter, caplog):
+    redis_adapter.sync_from(local_adapter)
+
+    with caplog.at_level(logging.INFO, logger=LOGGER.name):
+        redis_adapter.sync_from(changed_local_adapter)
+
+    assert "Created 1 employees in Redis" in caplog.text
+
+
+def test_outdated_records(redis_adapter, employees):
+    for employee in employees:
+        redis_adapter.redis.hset(employee["username"], mapping=employee)
+
+    with pytest.raises(ValueError, match="3 employee records in Redis are in an outdated format.*invoke load-redis"):
+        redis_adapter.get_all("employee")
+    with pytest.raises(ValueError, match="invoke load-redis"):
+        redis_adapter.get("employee", "employee0")
+
+
+def test_missing_records(redis_adapter):
+    usernames = [f"employee{index}" for index in range(25)]
+
+    with pytest.raises(ObjectNotFound) as error:
+        redis_adapter.get_by_uids(usernames, "employee")
+    assert str(error.value) == f"employee {usernames[:10]} and 15 more not present in Redis"
+
+
+def _dump(adapter):
+    """Return the sorted keys in the adapter's redis, and the raw record stored under each."""
+    keys = sorted(adapter.redis.keys())
+    return keys, adapter.redis.mget(keys)